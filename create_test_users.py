@@ -9,49 +9,274 @@ r"""
 |_______|_____\_|
 """
 
+import asyncio
+import logging
+import re
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from logging.handlers import MemoryHandler
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import aiohttp
+except ImportError:  # only needed for async mode
+    aiohttp = None
+
+try:
+    import h2  # noqa: F401 (required by httpx for HTTP/2)
+    import httpx
+except ImportError:  # only needed for HTTP/2 in async mode
+    httpx = None
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # fall back to the (slower) stdlib encoder
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _loads = json.loads
 
 # ==================================================
 # Configurable Options
 # ==================================================
 
-USER_API_URL = "http://127.0.0.1:8000/api/users/"
-LOGIN_API_URL = "http://127.0.0.1:8000/api/token/"
-PROFILE_API_URL = "http://127.0.0.1:8000/api/user-profile/"
 
-EMAIL_PREFIX = "testuser"
-DOMAIN = "example.com"
-PASSWORD = "testpassword"
+@dataclass(frozen=True)
+class Config:
+    """
+    Configurable options for a CreateTestUsers run.
+
+    Edit the defaults below, or override individual options when
+    creating an instance, e.g. Config(COUNT=100, START=50).
+    """
+
+    USER_API_URL: str = "http://127.0.0.1:8000/api/users/"
+    LOGIN_API_URL: str = "http://127.0.0.1:8000/api/token/"
+    PROFILE_API_URL: str = "http://127.0.0.1:8000/api/user-profile/"
+    BULK_USER_API_URL: str = "http://127.0.0.1:8000/api/users/bulk/"
+
+    EMAIL_PREFIX: str = "testuser"
+    DOMAIN: str = "example.com"
+    PASSWORD: str = "testpassword"
 
-# Toggle for unique passwords per user
-# Set to True to append user index to PASSWORD
-# Set to False to use the same PASSWORD for all users
-UNIQUE_PASSWORDS = True
+    # Toggle for unique passwords per user
+    # Set to True to append user index to PASSWORD
+    # Set to False to use the same PASSWORD for all users
+    UNIQUE_PASSWORDS: bool = True
 
-# Toggle whether to create profiles for new users
-CREATE_PROFILES = True
+    # Toggle whether to create profiles for new users
+    CREATE_PROFILES: bool = True
 
-# Toggle whether to use token from
-# login response or user creation response
-USE_LOGIN_TOKEN = True
+    # Toggle whether to force a login for every user
+    # Set to False to reuse the access token from the user creation
+    # response (falls back to login if the response has no token)
+    # Set to True to always log in, e.g. to diagnose the login API
+    USE_LOGIN_TOKEN: bool = False
 
-# Starting index for user numbering
-START = 1
+    # Toggle whether to create all users in a single bulk request
+    # Falls back to one request per user if the bulk request fails
+    # (e.g. BULK_USER_API_URL responds with 404, or 400 on re-runs)
+    USE_BULK_CREATE: bool = True
 
-# Number of users to create
-COUNT = 5
+    # Starting index for user numbering
+    START: int = 1
 
-USER_CREATION_DELAY = 0.1
-LOGIN_DELAY = 0.2
-PROFILE_CREATION_DELAY = 0.3
+    # Number of users to create
+    COUNT: int = 5
+
+    # Maximum number of API requests sent per second (across all workers)
+    # Set to 0 to disable pacing and rely only on the server's
+    # Retry-After / X-RateLimit-* response headers
+    REQUESTS_PER_SECOND: int = 50
+
+    MAX_ERROR_DISPLAY: int = 10
+
+    # File every error of a run is written to, one JSON object per line
+    # Created on the first error and overwritten by each new run
+    # Only the first MAX_ERROR_DISPLAY errors are kept in memory for display
+    ERRORS_FILE: str = "errors.jsonl"
+
+    # Toggle async mode (requires aiohttp, or httpx when USE_HTTP2 is True)
+    # Set to True to process users concurrently on an asyncio event loop
+    # Set to False to process users on a pool of MAX_WORKERS threads
+    USE_ASYNC: bool = False
+
+    # Maximum number of users in-flight at once in async mode
+    # Also bounds the async client's connection pool, so every
+    # in-flight user can reuse a keep-alive connection
+    MAX_CONCURRENCY: int = 64
+
+    # Toggle HTTP/2 in async mode (requires httpx[http2])
+    # Multiplexes all requests over a single connection instead of one
+    # connection per in-flight request. https:// URLs negotiate HTTP/2 via
+    # TLS; http:// URLs use HTTP/2 prior knowledge (h2c), so the server
+    # must accept cleartext HTTP/2 (e.g. hypercorn, uvicorn with h2)
+    USE_HTTP2: bool = False
+
+    # Number of worker threads processing users in sync mode
+    # Also used as the requests HTTPAdapter pool size: with fewer pooled
+    # connections than workers, the extra threads open fresh connections
+    # and lose the keep-alive benefit
+    MAX_WORKERS: int = 16
 
-MAX_ERROR_DISPLAY = 10
 
 # ==================================================
 # ==================================================
 
 
+logger = logging.getLogger(__name__)
+
+# Network errors raised by whichever async backends are installed
+_ASYNC_NETWORK_ERRORS = ()
+if aiohttp is not None:
+    _ASYNC_NETWORK_ERRORS += (aiohttp.ClientError,)
+if httpx is not None:
+    _ASYNC_NETWORK_ERRORS += (httpx.HTTPError,)
+
+# Pre-serialized parts of the profile creation body {"user": <user_id>}
+_PROFILE_BODY_PREFIX = b'{"user":'
+_PROFILE_BODY_SUFFIX = b"}"
+
+# Maximum number of response body bytes kept per recorded error
+_ERROR_BODY_LIMIT = 200
+
+# Matches "exist" in raw 400 response bodies of already-registered users
+_EXISTS_RE = re.compile(rb"exist", re.IGNORECASE)
+
+
+class IndentFormatter(logging.Formatter):
+    """
+    Format log records as their message indented by 4 spaces per level.
+
+    The level is read from the record's "indent" attribute, passed via
+    extra={"indent": level}.
+    """
+
+    def format(self, record):
+        return " " * (4 * getattr(record, "indent", 0)) + record.getMessage()
+
+
+def _discard_log(message, **kwargs):
+    """
+    Stand-in for logger.info used by non-verbose instances.
+    """
+
+
+def configure_logging():
+    """
+    Send the module logger's records to stdout, batched 100 at a time.
+
+    Called once when the file is run as a script. Applications importing
+    this module keep control over their own logging configuration.
+    """
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(IndentFormatter())
+    logger.addHandler(MemoryHandler(capacity=100, target=stream_handler))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+class RateLimiter:
+    """
+    Thread-safe request pacer driven by a fixed rate and server headers.
+
+    Each request reserves the next free time slot, spaced 1 / rate seconds
+    apart. Responses advertising an exhausted quota (X-RateLimit-Remaining
+    <= 1) or a Retry-After header push the next slot further out, so the
+    client only sleeps when the server asks it to or the rate is exceeded.
+
+    Attributes:
+        interval (float): Minimum seconds between two requests (0 = unlimited).
+        next_allowed_ts (float): time.monotonic() timestamp of the next free slot.
+    """
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.next_allowed_ts = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Reserve the next request slot.
+
+        Returns:
+            float: Seconds the caller must wait before sending its request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self.next_allowed_ts)
+            self.next_allowed_ts = start + self.interval
+            return start - now
+
+    def acquire(self):
+        """
+        Block the current thread until a request slot is available.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def aacquire(self):
+        """
+        Async variant of acquire that yields to the event loop while waiting.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def update(self, headers):
+        """
+        Back off according to the rate-limit headers of a response.
+
+        Args:
+            headers (Mapping): Case-insensitive response headers.
+
+        Note:
+            Retry-After is honored whenever present. X-RateLimit-Remaining
+            only triggers a back-off when at most one request is left, in
+            which case X-RateLimit-Reset (seconds or epoch timestamp) is
+            used as the wait time.
+        """
+        delay = self._header_seconds(headers.get("Retry-After"))
+
+        if delay is None:
+            remaining = self._header_seconds(headers.get("X-RateLimit-Remaining"))
+            if remaining is None or remaining > 1:
+                return
+            delay = self._header_seconds(headers.get("X-RateLimit-Reset"))
+            if delay is None:
+                delay = self.interval or 1.0
+            elif delay > 1_000_000_000:  # epoch timestamp, not a delta
+                delay -= time.time()
+
+        if delay > 0:
+            with self._lock:
+                self.next_allowed_ts = max(
+                    self.next_allowed_ts, time.monotonic() + delay
+                )
+
+    @staticmethod
+    def _header_seconds(value):
+        """
+        Parse a numeric header value, returning None if missing or invalid.
+        """
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+
 class CreateTestUsers:
     """
     A test user creation utility for bulk user and profile generation.
@@ -62,18 +287,37 @@ class CreateTestUsers:
 
     Attributes:
         verbose (bool): Enable detailed logging output.
+        cfg (Config): Options for this run.
         users_created (int): Counter for successfully created users.
         profiles_created (int): Counter for successfully created profiles.
         failed (int): Counter for failed operations.
-        errors (list): List of tuples containing (email, error_message) for failed operations.
+        errors (list): First MAX_ERROR_DISPLAY (email, error_message) tuples for failed
+            operations. The full list is streamed to ERRORS_FILE.
+        session (requests.Session): Shared session reusing pooled keep-alive connections.
+        rate_limiter (RateLimiter): Paces every API request sent by this instance.
+        DEFAULT_TIMEOUT (tuple): (connect, read) timeout in seconds for every request.
+        BULK_TIMEOUT (tuple): (connect, read) timeout in seconds for the bulk
+            creation request, which hashes every password in one call.
     """
 
-    def __init__(self, verbose=True):
+    DEFAULT_TIMEOUT = (1.0, 5.0)
+    BULK_TIMEOUT = (1.0, 120.0)
+
+    def __init__(self, verbose=True, cfg=None):
         self.verbose = verbose
+        self.cfg = cfg if cfg is not None else Config()
+        # Profile creation URL, disabling w8 generation during creation
+        self._profile_url = f"{self.cfg.PROFILE_API_URL}?w8=false"
+        # Per-instance verbosity: a quiet instance never touches the logger
+        self._log = logger.info if verbose else _discard_log
         self.users_created = 0
         self.profiles_created = 0
         self.failed = 0
         self.errors = []
+        self._errors_file = None  # opened on the first recorded error
+        self.session = self._build_session()
+        self.rate_limiter = RateLimiter(self.cfg.REQUESTS_PER_SECOND)
+        self._lock = threading.Lock()
 
     def __str__(self):
         return (
@@ -84,33 +328,130 @@ class CreateTestUsers:
 
     __repr__ = __str__
 
-    def wait(self, delay_name):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def flush_log(self):
+        """
+        Write out any buffered log records.
+        """
+        for handler in logger.handlers:
+            handler.flush()
+
+    def _build_session(self):
+        """
+        Build a requests session with pooled keep-alive connections.
+
+        Every API call goes through this session, so the TCP connection
+        to the server is reused instead of being re-established per request.
+        Connection failures and 429/503 responses are retried by the
+        adapter with exponential backoff, honoring Retry-After. Read
+        errors are never retried: a POST that timed out may already have
+        been applied by the server, and re-sending it would turn a created
+        user into an "already exists" skip. Once retries are exhausted the
+        last response is returned rather than raised.
+
+        Returns:
+            requests.Session: Session with a retrying HTTPAdapter mounted
+                on both http:// and https://.
+        """
+        session = requests.Session()
+        # Size the pool to the worker count so every thread keeps its own
+        # warm connection instead of opening a new, discarded one
+        adapter = HTTPAdapter(
+            pool_connections=self.cfg.MAX_WORKERS,
+            pool_maxsize=self.cfg.MAX_WORKERS,
+            max_retries=Retry(
+                total=3,
+                read=False,
+                backoff_factor=0.2,
+                status_forcelist=[429, 503],
+                allowed_methods=["POST"],
+                raise_on_status=False,
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(
+            {"Content-Type": "application/json", "Connection": "keep-alive"}
+        )
+        return session
+
+    def close(self):
+        """
+        Close the shared session and the errors file, flushing buffered logs.
+        """
+        self.flush_log()
+        self.session.close()
+        if self._errors_file is not None:
+            self._errors_file.close()
+
+    def post(self, url, **kwargs):
         """
-        Apply a configured delay based on the operation type.
+        Send a rate-limited POST request through the shared session.
+
+        Waits for a slot from the rate limiter, sends the request and feeds
+        the response's rate-limit headers back into the limiter.
 
         Args:
-            delay_name (str): Type of delay to apply. Valid values:
-                - 'user': USER_CREATION_DELAY
-                - 'login': LOGIN_DELAY
-                - 'profile': PROFILE_CREATION_DELAY
+            url (str): Target URL.
+            **kwargs: Passed through to requests.Session.post. The timeout
+                defaults to DEFAULT_TIMEOUT.
 
-        Note:
-            If an invalid delay_name is provided, no delay is applied (0 seconds).
+        Returns:
+            requests.Response: The server response.
         """
-        delays = {
-            "user": USER_CREATION_DELAY,
-            "login": LOGIN_DELAY,
-            "profile": PROFILE_CREATION_DELAY,
-        }
-        time.sleep(delays.get(delay_name, 0))
+        kwargs.setdefault("timeout", self.DEFAULT_TIMEOUT)
+        self.rate_limiter.acquire()
+        response = self.session.post(url, **kwargs)
+        self.rate_limiter.update(response.headers)
+        return response
+
+    def record_failure(self, email=None, message=None):
+        """
+        Count a failed operation and optionally record its error message.
+
+        The error is written to ERRORS_FILE, which is created (truncating
+        any file from a previous run) on the first error. The first
+        MAX_ERROR_DISPLAY errors are also kept in the errors list. Safe to
+        call from worker threads; all updates happen under a lock.
+
+        Args:
+            email (str, optional): Email of the user the failure belongs to.
+            message (str or bytes, optional): Error message. Raw response
+                bodies may be passed as bytes (already sliced to
+                _ERROR_BODY_LIMIT) and are decoded here. If omitted, only
+                the failure counter is incremented.
+        """
+        if isinstance(message, bytes):
+            message = message.decode("utf-8", "ignore")
+
+        with self._lock:
+            self.failed += 1
+            if message is not None:
+                if self._errors_file is None:
+                    self._errors_file = open(self.cfg.ERRORS_FILE, "wb")
+                self._errors_file.write(
+                    _dumps({"email": email, "msg": message}) + b"\n"
+                )
+                if len(self.errors) < self.cfg.MAX_ERROR_DISPLAY:
+                    self.errors.append((email, message))
 
     def short_text(self, text, limit=100):
         """
         Truncate text to a specified length with ellipsis if longer.
 
         Args:
-            text (str): The text to potentially truncate.
-            limit (int, optional): Maximum character length. Defaults to 100.
+            text (str or bytes): The text to potentially truncate. Raw
+                response bodies are sliced before being decoded, so large
+                bodies are never decoded in full, and a character split by
+                the cut is dropped.
+            limit (int, optional): Maximum length, in characters for str
+                and in bytes for bytes. Defaults to 100.
 
         Returns:
             str: Original text if within limit, otherwise truncated text with '...' appended.
@@ -119,6 +460,9 @@ class CreateTestUsers:
             >>> short_text("A very long error message...", limit=10)
             Output: 'A very lon...'
         """
+        if isinstance(text, bytes):
+            suffix = "..." if len(text) > limit else ""
+            return text[:limit].decode("utf-8", "ignore") + suffix
         return text if len(text) <= limit else text[:limit] + "..."
 
     def log_line(self, message, level=0):
@@ -134,12 +478,12 @@ class CreateTestUsers:
                 adds 4 spaces of indentation. Defaults to 0.
 
         Note:
-            Logging only occurs if self.verbose is True.
+            Messages are emitted through the module logger at INFO level
+            and dropped without a call into logging when self.verbose is
+            False. When run as a script, configure_logging() buffers the
+            output; call flush_log() to write it out immediately.
         """
-        if not self.verbose:
-            return
-        indent = " " * (4 * level)
-        print(f"{indent}{message}")
+        self._log(message, extra={"indent": level})
 
     def login_user(self, email, password):
         """
@@ -159,11 +503,12 @@ class CreateTestUsers:
             Expects response structure: {"result": {"access": "token_string"}}
         """
         try:
-            response = requests.post(
-                LOGIN_API_URL, json={"email": email, "password": password}, timeout=10
+            response = self.post(
+                self.cfg.LOGIN_API_URL,
+                data=_dumps({"email": email, "password": password}),
             )
             if response.status_code in (200, 201):
-                data = response.json()
+                data = _loads(response.content)
                 result = data.get("result", {})
                 access = result.get("access")
 
@@ -172,24 +517,21 @@ class CreateTestUsers:
                     return access
                 else:
                     self.log_line(
-                        f"↳ [x] Login failed (missing access token): {self.short_text(response.text)}",
+                        f"↳ [x] Login failed (missing access token): {self.short_text(response.content)}",
                         level=2,
                     )
-                    self.failed += 1
-                    self.errors.append((email, response.text))
+                    self.record_failure(email, response.content[:_ERROR_BODY_LIMIT])
                     return None
             else:
                 self.log_line(
-                    f"↳ [x] Login failed: {response.status_code} {self.short_text(response.text)}",
+                    f"↳ [x] Login failed: {response.status_code} {self.short_text(response.content)}",
                     level=2,
                 )
-                self.failed += 1
-                self.errors.append((email, response.text))
+                self.record_failure(email, response.content[:_ERROR_BODY_LIMIT])
                 return None
         except Exception as e:
             self.log_line(f"↳ [!] Exception during login: {e}", level=2)
-            self.failed += 1
-            self.errors.append((email, str(e)))
+            self.record_failure(email, str(e))
             return None
 
     def create_user_profile(self, user_id, email, access_token):
@@ -211,227 +553,695 @@ class CreateTestUsers:
             Profile creation includes ?w8=false parameter to disable
             w8 generation during the creation process.
         """
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        # Content-Type is already set on the session
+        headers = {"Authorization": f"Bearer {access_token}"}
 
-        profile_data = {"user": user_id}
-        profile_url = f"{PROFILE_API_URL}?w8=false"  # disable w8 generation
+        body = _PROFILE_BODY_PREFIX + _dumps(user_id) + _PROFILE_BODY_SUFFIX
 
         try:
-            response = requests.post(
-                profile_url, json=profile_data, headers=headers, timeout=10
-            )
+            response = self.post(self._profile_url, data=body, headers=headers)
 
             if response.status_code in (200, 201):
                 self.log_line(f"↳ [✓] User profile created for {email}", level=2)
-                self.profiles_created += 1
+                with self._lock:
+                    self.profiles_created += 1
                 return True
             else:
                 self.log_line(
-                    f"↳ [x] Failed to create profile: {response.status_code} {self.short_text(response.text)}",
+                    f"↳ [x] Failed to create profile: {response.status_code} {self.short_text(response.content)}",
                     level=2,
                 )
-                self.failed += 1
-                self.errors.append((email, f"profile: {response.text}"))
+                self.record_failure(
+                    email, b"profile: " + response.content[:_ERROR_BODY_LIMIT]
+                )
                 return False
         except Exception as e:
             self.log_line(f"↳ [!] Exception during profile creation: {e}", level=2)
-            self.failed += 1
-            self.errors.append((email, str(e)))
+            self.record_failure(email, str(e))
             return False
 
+    def log_header(self):
+        """
+        Log the run banner and configuration warnings.
+        """
+        cfg = self.cfg
+
+        self.log_line("=" * 50)
+        self.log_line(
+            f"Starting user creation: {cfg.COUNT} user(s) from index {cfg.START}"
+        )
+        self.log_line("=" * 50 + "\n")
+
+        self.log_line(
+            f"Token source: {'Login API' if cfg.USE_LOGIN_TOKEN else 'User Creation API (login fallback)'}\n"
+        )
+
+        if not cfg.CREATE_PROFILES and cfg.USE_LOGIN_TOKEN:
+            self.log_line(
+                "[!] Warning: USE_LOGIN_TOKEN is True but CREATE_PROFILES is False\n"
+            )
+
+    def bulk_create_users(self, user_dicts):
+        """
+        Create many users in a single request to BULK_USER_API_URL.
+
+        Args:
+            user_dicts (list): User payloads, each with "email", "username"
+                and "password" keys.
+
+        Returns:
+            list or None: (user_id, email, password, access_token) tuples for
+                the created users, ready for _provision_user. None if the bulk
+                request failed (unsupported endpoint, error response such as
+                "already exists" on a re-run, or a connection error) and the
+                caller should fall back to creating users one by one.
+
+        Note:
+            Expects response structure: {"result": [{"id": ..., "email": ..., "access": ...}]}
+            Falls back only when the request was never applied (connection
+            error or non-2xx status). After a read timeout or a 2xx response
+            that cannot be parsed, the server may already have created the
+            users, so the failure is recorded and [] is returned instead.
+        """
+        self.log_line(f"[.] Bulk creating {len(user_dicts)} user(s)...")
+
+        try:
+            response = self.post(
+                self.cfg.BULK_USER_API_URL,
+                data=_dumps(user_dicts),
+                timeout=self.BULK_TIMEOUT,
+            )
+        except requests.ReadTimeout as e:
+            self.log_line(f"↳ [!] Bulk creation timed out: {e}", level=1)
+            self.record_failure(None, f"bulk: {e}")
+            return []
+        except Exception as e:
+            self.log_line(f"↳ [!] Exception during bulk creation: {e}", level=1)
+            self.log_line("↳ [~] Creating users one by one\n", level=1)
+            return None
+
+        if response.status_code not in (200, 201):
+            self.log_line(
+                f"↳ [~] Bulk creation unavailable: {response.status_code} {self.short_text(response.content)}",
+                level=1,
+            )
+            self.log_line("↳ [~] Creating users one by one\n", level=1)
+            return None
+
+        # The server accepted the request, so the users may exist now:
+        # from here on errors are recorded instead of falling back
+        try:
+            passwords = {user["email"]: user["password"] for user in user_dicts}
+            returned = set()
+            created = []
+            for user in _loads(response.content).get("result", []):
+                user_id = user.get("id")
+                email = user.get("email")
+                returned.add(email)
+
+                if not user_id or email not in passwords:
+                    self.log_line(
+                        f"↳ [!] Created user but couldn't find ID or email in response: {user}",
+                        level=1,
+                    )
+                    self.record_failure(email, f"bulk: incomplete result {user}")
+                    continue
+
+                self.log_line(f"↳ [✓] Created user: {email} (ID: '{user_id}')", level=1)
+                created.append((user_id, email, passwords[email], user.get("access")))
+        except Exception as e:
+            self.log_line(f"↳ [!] Invalid bulk creation response: {e}", level=1)
+            self.record_failure(
+                None, b"bulk: invalid response: " + response.content[:_ERROR_BODY_LIMIT]
+            )
+            return []
+
+        for email in sorted(passwords.keys() - returned):
+            self.log_line(
+                f"↳ [x] Missing from bulk creation response: {email}", level=1
+            )
+            self.record_failure(email, "bulk: missing from response")
+
+        with self._lock:
+            self.users_created += len(created)
+        return created
+
+    def _provision_user(self, user_id, email, password, creation_token=None):
+        """
+        Obtain an access token for a created user and create their profile.
+
+        Args:
+            user_id (str or int): ID of the created user.
+            email (str): User's email address.
+            password (str): User's password (used when logging in).
+            creation_token (str, optional): Access token returned alongside
+                the created user. Reused unless USE_LOGIN_TOKEN is True; a
+                login is only performed when it is missing.
+        """
+        cfg = self.cfg
+
+        if not cfg.CREATE_PROFILES:
+            self.log_line("↳ [~] Skipped profile creation (disabled)", level=1)
+            return
+
+        # ===== USE TOKEN FROM USER CREATION RESPONSE =====
+
+        access_token = None if cfg.USE_LOGIN_TOKEN else creation_token
+        if access_token:
+            self.log_line(
+                "↳ [✓] Using access token from user creation response",
+                level=1,
+            )
+        else:
+            # ===== LOGIN USER TO GET TOKEN =====
+
+            self.log_line("↳ [.] Attempting login to get access token...", level=1)
+            access_token = self.login_user(email, password)
+            if not access_token:
+                return
+
+        # ===== CREATE USER PROFILE =====
+
+        self.log_line("↳ [.] Attempting user profile creation...", level=1)
+        self.create_user_profile(user_id, email, access_token)
+
+    def build_jobs(self):
+        """
+        Build the (index, email, password) tuple for every user to create.
+
+        Emails and passwords are generated up front as plain lists by string
+        concatenation, then zipped with their indices, so the result can be
+        handed straight to the thread pool or asyncio.gather.
+
+        Returns:
+            list: (i, email, password) tuples for indices START..START+COUNT-1.
+        """
+        cfg = self.cfg
+        start, count = cfg.START, cfg.COUNT
+        indices = range(start, start + count)
+
+        # The comprehensions below only read locals
+        prefix = cfg.EMAIL_PREFIX
+        suffix = "@" + cfg.DOMAIN
+        emails = [prefix + str(i) + suffix for i in indices]
+
+        password = cfg.PASSWORD
+        if cfg.UNIQUE_PASSWORDS:
+            passwords = [password + str(i) for i in indices]
+        else:
+            passwords = [password] * count
+
+        return list(zip(indices, emails, passwords))
+
+    def _process_user(self, i, email, password):
+        """
+        Run the create -> login -> profile pipeline for a single user.
+
+        Executed on a worker thread by create_test_users; counters are only
+        updated through the lock-guarded helpers.
+
+        Args:
+            i (int): User index (used for progress logging).
+            email (str): User's email address.
+            password (str): User's password.
+        """
+        cfg = self.cfg
+        user_data = {
+            "email": email,
+            "username": email,
+            "password": password,
+        }
+
+        try:
+            # ===== CREATE USER =====
+
+            self.log_line(
+                f"[.] Processing user {i - cfg.START + 1}/{cfg.COUNT}: {email}"
+            )
+
+            response = self.post(cfg.USER_API_URL, data=_dumps(user_data))
+
+            if response.status_code in (200, 201):
+                result = _loads(response.content)
+                user_result = result.get("result", {})
+                user_id = user_result.get("id")
+
+                if not user_id:
+                    self.log_line(
+                        f"↳ [!] Created user but couldn't find ID in response: {email}",
+                        level=1,
+                    )
+                    self.record_failure()
+                    return
+
+                self.log_line(
+                    f"↳ [✓] Created user: {email} (ID: '{user_id}') (Password: '{password}')",
+                    level=1,
+                )
+                with self._lock:
+                    self.users_created += 1
+
+                self._provision_user(
+                    user_id, email, password, user_result.get("access")
+                )
+            elif response.status_code == 400 and _EXISTS_RE.search(response.content):
+                self.log_line(f"↳ [~] Skipped existing user: {email}", level=1)
+            else:
+                self.log_line(
+                    f"↳ [x] Failed for {email}: {response.status_code} {self.short_text(response.content)}",
+                    level=1,
+                )
+                self.record_failure(email, response.content[:_ERROR_BODY_LIMIT])
+        except requests.RequestException as e:
+            self.log_line(f"↳ [!] Network error for {email}: {e}", level=1)
+            self.record_failure(email, str(e))
+        except Exception as e:
+            self.log_line(f"↳ [!] Unexpected error for {email}: {e}", level=1)
+            self.record_failure(email, str(e))
+
     def create_test_users(self):
         """
         Create multiple test users with optional profile creation.
 
         This method orchestrates the bulk creation of test users based on
         configuration settings. It handles user creation, authentication
-        (via login or token extraction), and profile creation with
-        appropriate delays between operations.
+        (via login or token extraction), and profile creation while
+        respecting the configured rate limit.
 
         The process for each user:
-            1. Create user account via USER_API_URL
+            1. Create user account via USER_API_URL (or all accounts at once
+               via BULK_USER_API_URL when USE_BULK_CREATE is True)
             2. If CREATE_PROFILES is True:
-               - Get access token (via login or from creation response)
+               - Reuse the access token from the creation response,
+                 logging in only if it is missing (or USE_LOGIN_TOKEN is True)
                - Create user profile via PROFILE_API_URL
-            3. Apply configured delays between operations
+            3. Pace every request through the shared rate limiter
+
+        Users are processed concurrently on MAX_WORKERS threads sharing
+        the same session, so log lines of different users may interleave.
 
-        Configuration options used:
+        Configuration options used (from self.cfg):
             - START: Starting index for user numbering
             - COUNT: Number of users to create
-            - USE_LOGIN_TOKEN: Token source selection
+            - USE_LOGIN_TOKEN: Force login instead of reusing the creation token
             - CREATE_PROFILES: Enable/disable profile creation
             - UNIQUE_PASSWORDS: Use unique passwords per user
-            - Various delay settings for rate limiting
+            - USE_BULK_CREATE: Create all users in a single request
+            - MAX_WORKERS: Number of users processed concurrently
+            - REQUESTS_PER_SECOND: Rate limit shared by all requests
 
         Returns:
             dict: Summary of operations containing:
                 - users_created (int): Number of successfully created users
                 - profiles_created (int): Number of successfully created profiles
                 - failed (int): Number of failed operations
-                - errors (list): List of (email, error_message) tuples
+                - errors (list): First MAX_ERROR_DISPLAY (email, error_message) tuples
+                - errors_file (str or None): Path of the file holding every error
+                  of this run, or None if there were none
 
         Note:
             Existing users (detected via 400 status with "exist" in response)
             are skipped and not counted as failures.
         """
-        self.log_line("=" * 50)
-        self.log_line(f"Starting user creation: {COUNT} user(s) from index {START}")
-        self.log_line("=" * 50 + "\n")
+        self.log_header()
 
-        self.log_line(
-            f"Token source: {'Login API' if USE_LOGIN_TOKEN else 'User Creation API'}\n"
+        jobs = self.build_jobs()
+
+        created = None
+        if self.cfg.USE_BULK_CREATE:
+            created = self.bulk_create_users(
+                [
+                    {"email": email, "username": email, "password": password}
+                    for _, email, password in jobs
+                ]
+            )
+
+        executor = ThreadPoolExecutor(max_workers=self.cfg.MAX_WORKERS)
+        try:
+            if created is None:
+                futures = [executor.submit(self._process_user, *job) for job in jobs]
+            else:
+                futures = [
+                    executor.submit(self._provision_user, *user) for user in created
+                ]
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            # Drop queued users (e.g. on Ctrl-C) instead of running them all
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
+        return self.summarize()
+
+    def summarize(self):
+        """
+        Print the final counters and return them as a summary dict.
+
+        The report is assembled in memory and written to stdout in a single
+        call (only when verbose is True).
+
+        Returns:
+            dict: Summary of operations containing:
+                - users_created (int): Number of successfully created users
+                - profiles_created (int): Number of successfully created profiles
+                - failed (int): Number of failed operations
+                - errors (list): First MAX_ERROR_DISPLAY (email, error_message) tuples
+                - errors_file (str or None): Path of the file holding every error
+                  of this run, or None if there were none
+        """
+        errors_file = None
+        if self._errors_file is not None:
+            self._errors_file.flush()
+            errors_file = self.cfg.ERRORS_FILE
+
+        # Summarize results
+        if self.verbose:
+            parts = [
+                "\n" + "=" * 50,
+                f"[✓] Users created: {self.users_created}",
+                f"[✓] Profiles created: {self.profiles_created}",
+                f"[x] Failed: {self.failed}",
+            ]
+            if self.errors:
+                parts.append(f"\nErrors (showing {len(self.errors)}):")
+                for email, msg in self.errors:
+                    parts.append(f"    - {email}: {self.short_text(msg, limit=200)}")
+            if errors_file is not None:
+                parts.append(f"\nAll errors: {errors_file}")
+            parts.append("=" * 50)
+
+            # Emit buffered progress lines first to keep output in order
+            self.flush_log()
+            sys.stdout.write("\n".join(parts) + "\n")
+
+        # Return summary
+        return {
+            "users_created": self.users_created,
+            "profiles_created": self.profiles_created,
+            "failed": self.failed,
+            "errors": list(self.errors),
+            "errors_file": errors_file,
+        }
+
+    def _open_async_session(self):
+        """
+        Create the async HTTP client shared by all users in async mode.
+
+        Uses an httpx.AsyncClient speaking HTTP/2 when USE_HTTP2 is True and
+        httpx (with h2) is installed, so requests are multiplexed over a
+        single connection. For http:// URLs HTTP/1.1 is disabled, which
+        makes httpx use HTTP/2 prior knowledge instead of silently staying
+        on HTTP/1.1. Otherwise an aiohttp.ClientSession is used.
+
+        Returns:
+            httpx.AsyncClient or aiohttp.ClientSession: Client to be used
+                as an async context manager.
+
+        Raises:
+            RuntimeError: If neither backend is installed.
+        """
+        headers = {"Content-Type": "application/json"}
+
+        if self.cfg.USE_HTTP2 and httpx is not None:
+            cleartext = self.cfg.USER_API_URL.startswith("http://")
+            return httpx.AsyncClient(
+                http1=not cleartext,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=self.cfg.MAX_CONCURRENCY,
+                    max_keepalive_connections=self.cfg.MAX_CONCURRENCY,
+                ),
+                timeout=httpx.Timeout(
+                    self.DEFAULT_TIMEOUT[1], connect=self.DEFAULT_TIMEOUT[0]
+                ),
+                headers=headers,
+            )
+
+        if aiohttp is None:
+            raise RuntimeError(
+                "Async mode requires aiohttp (pip install aiohttp), or "
+                "httpx[http2] with USE_HTTP2 enabled"
+            )
+
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=self.cfg.MAX_CONCURRENCY),
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=self.DEFAULT_TIMEOUT[0], sock_read=self.DEFAULT_TIMEOUT[1]
+            ),
+            headers=headers,
         )
 
-        if not CREATE_PROFILES and USE_LOGIN_TOKEN:
-            self.log_line(
-                "[!] Warning: USE_LOGIN_TOKEN is True but CREATE_PROFILES is False\n"
+    async def apost(self, session, url, data, headers=None):
+        """
+        Async variant of post, working with either async backend.
+
+        Args:
+            session (httpx.AsyncClient or aiohttp.ClientSession): Client
+                returned by _open_async_session.
+            url (str): Target URL.
+            data (bytes): Pre-serialized JSON request body.
+            headers (dict, optional): Extra request headers.
+
+        Returns:
+            tuple: (status_code, body) with the body as raw bytes.
+        """
+        await self.rate_limiter.aacquire()
+
+        if httpx is not None and isinstance(session, httpx.AsyncClient):
+            response = await session.post(url, content=data, headers=headers)
+            self.rate_limiter.update(response.headers)
+            return response.status_code, response.content
+
+        async with session.post(url, data=data, headers=headers) as response:
+            self.rate_limiter.update(response.headers)
+            return response.status, await response.read()
+
+    async def alogin_user(self, session, email, password):
+        """
+        Async variant of login_user using a shared async client.
+
+        Args:
+            session (httpx.AsyncClient or aiohttp.ClientSession): Client
+                used for the request.
+            email (str): User's email address.
+            password (str): User's password.
+
+        Returns:
+            str or None: JWT access token if login successful, None otherwise.
+        """
+        try:
+            status, body = await self.apost(
+                session,
+                self.cfg.LOGIN_API_URL,
+                _dumps({"email": email, "password": password}),
             )
+            if status in (200, 201):
+                access = _loads(body).get("result", {}).get("access")
+
+                if access:
+                    self.log_line(f"↳ [✓] Logged in: {email}", level=2)
+                    return access
+                else:
+                    self.log_line(
+                        f"↳ [x] Login failed (missing access token): {self.short_text(body)}",
+                        level=2,
+                    )
+                    self.record_failure(email, body[:_ERROR_BODY_LIMIT])
+                    return None
+            else:
+                self.log_line(
+                    f"↳ [x] Login failed: {status} {self.short_text(body)}",
+                    level=2,
+                )
+                self.record_failure(email, body[:_ERROR_BODY_LIMIT])
+                return None
+        except Exception as e:
+            message = str(e) or repr(e)
+            self.log_line(f"↳ [!] Exception during login: {message}", level=2)
+            self.record_failure(email, message)
+            return None
+
+    async def acreate_user_profile(self, session, user_id, email, access_token):
+        """
+        Async variant of create_user_profile using a shared async client.
+
+        Args:
+            session (httpx.AsyncClient or aiohttp.ClientSession): Client
+                used for the request.
+            user_id (str or int): The ID of the user for whom to create a profile.
+            email (str): User's email address (used for logging only).
+            access_token (str): JWT access token for authentication.
+
+        Returns:
+            bool: True if profile created successfully, False otherwise.
+        """
+        # Content-Type is already set on the session
+        headers = {"Authorization": f"Bearer {access_token}"}
 
-        for i in range(START, START + COUNT):
-            email = f"{EMAIL_PREFIX}{i}@{DOMAIN}"
+        data = _PROFILE_BODY_PREFIX + _dumps(user_id) + _PROFILE_BODY_SUFFIX
 
-            if UNIQUE_PASSWORDS:
-                password = f"{PASSWORD}{i}"
+        try:
+            status, body = await self.apost(
+                session, self._profile_url, data, headers=headers
+            )
+            if status in (200, 201):
+                self.log_line(f"↳ [✓] User profile created for {email}", level=2)
+                with self._lock:
+                    self.profiles_created += 1
+                return True
             else:
-                password = PASSWORD
+                self.log_line(
+                    f"↳ [x] Failed to create profile: {status} {self.short_text(body)}",
+                    level=2,
+                )
+                self.record_failure(email, b"profile: " + body[:_ERROR_BODY_LIMIT])
+                return False
+        except Exception as e:
+            message = str(e) or repr(e)
+            self.log_line(
+                f"↳ [!] Exception during profile creation: {message}", level=2
+            )
+            self.record_failure(email, message)
+            return False
+
+    async def aprocess_user(self, session, i, email, password):
+        """
+        Run the create -> login -> profile pipeline for a single user.
 
-            user_data = {
-                "email": email,
-                "username": email,
-                "password": password,
-            }
+        Mirrors _process_user, but awaits network calls so other users
+        can progress in the meantime.
 
-            try:
-                # ===== CREATE USER =====
+        Args:
+            session (httpx.AsyncClient or aiohttp.ClientSession): Client
+                used for all requests.
+            i (int): User index (used for progress logging).
+            email (str): User's email address.
+            password (str): User's password.
+        """
+        cfg = self.cfg
+        user_data = {
+            "email": email,
+            "username": email,
+            "password": password,
+        }
 
-                self.log_line(f"[.] Processing user {i - START + 1}/{COUNT}: {email}")
+        try:
+            # ===== CREATE USER =====
 
-                response = requests.post(USER_API_URL, json=user_data, timeout=10)
+            self.log_line(
+                f"[.] Processing user {i - cfg.START + 1}/{cfg.COUNT}: {email}"
+            )
 
-                if response.status_code in (200, 201):
-                    result = response.json()
-                    user_result = result.get("result", {})
-                    user_id = user_result.get("id")
+            status, body = await self.apost(
+                session, cfg.USER_API_URL, _dumps(user_data)
+            )
 
-                    if not user_id:
-                        self.log_line(
-                            f"↳ [!] Created user but couldn't find ID in response: {email}",
-                            level=1,
-                        )
-                        self.failed += 1
-                        continue
+            if status in (200, 201):
+                user_result = _loads(body).get("result", {})
+                user_id = user_result.get("id")
 
+                if not user_id:
                     self.log_line(
-                        f"↳ [✓] Created user: {email} (ID: '{user_id}') (Password: '{password}')",
+                        f"↳ [!] Created user but couldn't find ID in response: {email}",
                         level=1,
                     )
+                    self.record_failure()
+                    return
+
+                self.log_line(
+                    f"↳ [✓] Created user: {email} (ID: '{user_id}') (Password: '{password}')",
+                    level=1,
+                )
+                with self._lock:
                     self.users_created += 1
 
-                    if CREATE_PROFILES:
-                        access_token = None
-
-                        if USE_LOGIN_TOKEN:
-                            # ===== LOGIN USER TO GET TOKEN =====
-
-                            # Small delay to ensure user is
-                            # fully created before login
-                            self.wait("login")
-
-                            self.log_line(
-                                "↳ [.] Attempting login to get access token...",
-                                level=1,
-                            )
-                            access_token = self.login_user(email, password)
-                            if not access_token:
-                                continue
-
-                            # Small delay to ensure login process
-                            # is complete before profile creation
-                            self.wait("profile")
-                        else:
-                            # ===== USE TOKEN FROM USER CREATION RESPONSE =====
-
-                            access_token = user_result.get("access")
-                            if access_token:
-                                self.log_line(
-                                    "↳ [✓] Using access token from user creation response",
-                                    level=1,
-                                )
-                            else:
-                                self.log_line(
-                                    f"↳ [x] Access token not found in user creation response for {email}",
-                                    level=1,
-                                )
-                                self.failed += 1
-                                self.errors.append(
-                                    (email, "Missing access token in creation response")
-                                )
-                                continue
-
-                        # ===== CREATE USER PROFILE =====
-
-                        self.log_line(
-                            "↳ [.] Attempting user profile creation...", level=1
-                        )
-                        profile_creation = self.create_user_profile(
-                            user_id, email, access_token
-                        )
-                        if not profile_creation:
-                            continue
-                    else:
-                        self.log_line(
-                            "↳ [~] Skipped profile creation (disabled)", level=1
-                        )
-                elif response.status_code == 400 and "exist" in response.text.lower():
-                    self.log_line(f"↳ [~] Skipped existing user: {email}", level=1)
-                else:
+                if not cfg.CREATE_PROFILES:
+                    self.log_line("↳ [~] Skipped profile creation (disabled)", level=1)
+                    return
+
+                # ===== USE TOKEN FROM USER CREATION RESPONSE =====
+
+                access_token = (
+                    None if cfg.USE_LOGIN_TOKEN else user_result.get("access")
+                )
+                if access_token:
                     self.log_line(
-                        f"↳ [x] Failed for {email}: {response.status_code} {self.short_text(response.text)}",
+                        "↳ [✓] Using access token from user creation response",
                         level=1,
                     )
-                    self.failed += 1
-                    self.errors.append((email, response.text))
-            except requests.RequestException as e:
-                self.log_line(f"↳ [!] Network error for {email}: {e}", level=1)
-                self.failed += 1
-                self.errors.append((email, str(e)))
-            except Exception as e:
-                self.log_line(f"↳ [!] Unexpected error for {email}: {e}", level=1)
-                self.failed += 1
-                self.errors.append((email, str(e)))
-
-            # Small delay before next user creation
-            self.wait("user")
+                else:
+                    # ===== LOGIN USER TO GET TOKEN =====
 
-        # Summarize results
-        self.log_line("\n" + "=" * 50)
-        self.log_line(f"[✓] Users created: {self.users_created}")
-        self.log_line(f"[✓] Profiles created: {self.profiles_created}")
-        self.log_line(f"[x] Failed: {self.failed}")
-        if self.errors:
-            self.log_line(
-                f"\nErrors (showing {min(MAX_ERROR_DISPLAY, len(self.errors))}):"
+                    self.log_line(
+                        "↳ [.] Attempting login to get access token...", level=1
+                    )
+                    access_token = await self.alogin_user(session, email, password)
+                    if not access_token:
+                        return
+
+                # ===== CREATE USER PROFILE =====
+
+                self.log_line("↳ [.] Attempting user profile creation...", level=1)
+                await self.acreate_user_profile(session, user_id, email, access_token)
+            elif status == 400 and _EXISTS_RE.search(body):
+                self.log_line(f"↳ [~] Skipped existing user: {email}", level=1)
+            else:
+                self.log_line(
+                    f"↳ [x] Failed for {email}: {status} {self.short_text(body)}",
+                    level=1,
+                )
+                self.record_failure(email, body[:_ERROR_BODY_LIMIT])
+        except _ASYNC_NETWORK_ERRORS as e:
+            message = str(e) or repr(e)
+            self.log_line(f"↳ [!] Network error for {email}: {message}", level=1)
+            self.record_failure(email, message)
+        except Exception as e:
+            message = str(e) or repr(e)
+            self.log_line(f"↳ [!] Unexpected error for {email}: {message}", level=1)
+            self.record_failure(email, message)
+
+    async def acreate_test_users(self):
+        """
+        Async variant of create_test_users.
+
+        Schedules every user on the event loop at once, bounded by
+        MAX_CONCURRENCY, so wall time is dominated by the slowest request
+        instead of the sum of all requests. Requests go over HTTP/2 when
+        USE_HTTP2 is enabled and httpx is installed (see _open_async_session).
+
+        Returns:
+            dict: Same summary as create_test_users.
+
+        Raises:
+            RuntimeError: If neither aiohttp nor httpx is installed.
+        """
+        session = self._open_async_session()
+
+        self.log_header()
+
+        semaphore = asyncio.Semaphore(self.cfg.MAX_CONCURRENCY)
+
+        async def process_one(session, job):
+            async with semaphore:
+                await self.aprocess_user(session, *job)
+
+        async with session:
+            await asyncio.gather(
+                *[process_one(session, job) for job in self.build_jobs()]
             )
-            for email, msg in self.errors[:MAX_ERROR_DISPLAY]:
-                self.log_line(f"- {email}: {self.short_text(msg, limit=200)}", level=1)
-        self.log_line("=" * 50)
 
-        # Return summary
-        return {
-            "users_created": self.users_created,
-            "profiles_created": self.profiles_created,
-            "failed": self.failed,
-            "errors": self.errors,
-        }
+        return self.summarize()
 
 
 if __name__ == "__main__":
+    configure_logging()
     try:
-        creator = CreateTestUsers()
-        creator.create_test_users()
+        with CreateTestUsers() as creator:
+            if creator.cfg.USE_ASYNC:
+                asyncio.run(creator.acreate_test_users())
+            else:
+                creator.create_test_users()
     except KeyboardInterrupt:
         print("\n[!] Interrupted by user. Exiting...")
     except Exception as e: